@@ -1,6 +1,11 @@
 from .game import Game, GameOver
-from .storage import load_config_from_text, load_items_config, load_levels_config
-from .items import FoodItem, ForbiddenItem, PowerUpItem, BonusFoodItem
+from .storage import (
+    clear_config_cache,
+    load_config_from_text,
+    load_items_config,
+    load_levels_config,
+)
+from .items import Item, FoodItem, ForbiddenItem, PowerUpItem, BonusFoodItem
 from .managers import ItemFactory, ScoreManager, LevelManager
 from .game_state import GameState
 
@@ -10,6 +15,8 @@ __all__ = [
     "load_config_from_text",
     "load_items_config",
     "load_levels_config",
+    "clear_config_cache",
+    "Item",
     "FoodItem",
     "ForbiddenItem",
     "PowerUpItem",
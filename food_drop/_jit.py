@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def score_batch(points, multipliers, out):
+    total = 0
+    for i in range(len(points)):
+        value = int(points[i] * multipliers[i])
+        out[i] = value
+        total += value
+    return total
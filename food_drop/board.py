@@ -1,154 +1,285 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence, Tuple
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
+from ._jit import njit
 from .entities import Entity, Player
 
-Matrix = List[List[str]]
+Matrix = bytearray
 
 
-class Board(Sequence[str]):
+@njit(cache=True)
+def _advance(xs, ys, last_row, player_x, player_y):
+    kept = []
+    missed = []
+    caught = -1
+    for slot in range(len(ys)):
+        y = ys[slot]
+        if y < last_row:
+            kept.append(slot)
+            if xs[slot] == player_x and y + 1 == player_y:
+                caught = slot
+        else:
+            missed.append(slot)
+    return kept, missed, caught
+
+
+class BoardItems(Mapping[int, Entity]):
+    def __init__(self, board: Board):
+        self._board = board
+
+    def __getitem__(self, idx: int) -> Entity:
+        return self._board._entities[self._board._slots[idx]]
+
+    def __contains__(self, idx: object) -> bool:
+        return idx in self._board._slots
+
+    def get(self, idx: int, default: Entity | None = None) -> Entity | None:
+        slot = self._board._slots.get(idx)
+        if slot is None:
+            return default
+        return self._board._entities[slot]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._board._slots)
+
+    def __len__(self) -> int:
+        return len(self._board._entities)
+
+
+class Board(Sequence[List[str]]):
     def __init__(self, width: int, height: int, empty_symbol: str = "."):
         self.width = width
         self.height = height
         self.empty_symbol = empty_symbol
-   
-        self.grid: Matrix = [[empty_symbol for _ in range(width)] for _ in range(height)]
-        self.forbidden: set[str] = set()
-        self.items: Dict[Tuple[int, int], Entity] = {}
+        self._symbols: List[str] = [empty_symbol]
+        self._codes: Dict[str, int] = {empty_symbol: 0}
+        self._empty_code = 0
+        self._border = "+" + "-" * (width * 2 - 1) + "+"
+        self._all_positions: Tuple[Tuple[int, int], ...] = tuple(
+            (x, y) for y in range(height) for x in range(width)
+        )
+
+        self.grid: Matrix = bytearray(width * height)
+        self.forbidden: frozenset[str] = frozenset()
         self.player: Player | None = None
+        self.caught: Entity | None = None
+
+        self._xs = array("h")
+        self._ys = array("h")
+        self._sym = bytearray()
+        self._entities: List[Entity] = []
+        self._slots: Dict[int, int] = {}
+        self._by_row: List[List[int]] = [[] for _ in range(height)]
+        self._by_col: List[List[int]] = [[] for _ in range(width)]
+        self.items = BoardItems(self)
 
     def __len__(self) -> int:
-        return len(self.grid)
+        return self.height
 
     def __getitem__(self, index):
-        return self.grid[index]
+        if isinstance(index, slice):
+            return [self._cells(y) for y in range(self.height)[index]]
+        return self._cells(range(self.height)[index])
 
     def __iter__(self):
-        return iter(self.grid)
+        return (self._cells(y) for y in range(self.height))
 
     def __contains__(self, value: object) -> bool:
-    
-        return any(value in row for row in self.grid)
+        code = self._codes.get(value) if isinstance(value, str) else None
+        return code is not None and code in self.grid
+
+    def _idx(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def _code(self, symbol: str) -> int:
+        code = self._codes.get(symbol)
+        if code is None:
+            code = len(self._symbols)
+            if code > 255:
+                raise ValueError("Забагато різних символів на полі")
+            self._codes[symbol] = code
+            self._symbols.append(symbol)
+        return code
+
+    def _cells(self, y: int) -> List[str]:
+        start = y * self.width
+        return list(map(self._symbols.__getitem__, self.grid[start:start + self.width]))
 
     def reset(self) -> None:
-    
-        self.grid = [[self.empty_symbol for _ in range(self.width)] for _ in range(self.height)]
-        self.items.clear()
+        self.grid[:] = bytearray(self.width * self.height)
+        del self._xs[:], self._ys[:], self._sym[:], self._entities[:]
+        self.caught = None
+        self._slots.clear()
+        self._by_row = [[] for _ in range(self.height)]
+        self._by_col = [[] for _ in range(self.width)]
 
     def add_player(self, player: Player) -> None:
         self.player = player
 
     def _place(self, entity: Entity) -> None:
-        self.grid[entity.y][entity.x] = entity.symbol
-      
-        self.items[(entity.x, entity.y)] = entity
+        code = self._code(entity.symbol)
+        idx = self._idx(entity.x, entity.y)
+        self.grid[idx] = code
+        slot = self._slots.get(idx)
+        if slot is None:
+            self._slots[idx] = len(self._entities)
+            self._xs.append(entity.x)
+            self._ys.append(entity.y)
+            self._sym.append(code)
+            self._entities.append(entity)
+            self._by_row[entity.y].append(idx)
+            self._by_col[entity.x].append(idx)
+        else:
+            self._sym[slot] = code
+            self._entities[slot] = entity
 
     def clear_cell(self, x: int, y: int) -> None:
-        self.grid[y][x] = self.empty_symbol
-     
-        self.items.pop((x, y), None)
+        idx = self._idx(x, y)
+        self.grid[idx] = self._empty_code
+        slot = self._slots.pop(idx, None)
+        if slot is None:
+            return
+        if self._entities[slot] is self.caught:
+            self.caught = None
+        self._by_row[y].remove(idx)
+        self._by_col[x].remove(idx)
+        last = len(self._entities) - 1
+        if slot != last:
+            self._xs[slot] = self._xs[last]
+            self._ys[slot] = self._ys[last]
+            self._sym[slot] = self._sym[last]
+            self._entities[slot] = self._entities[last]
+            self._slots[self._ys[slot] * self.width + self._xs[slot]] = slot
+        self._xs.pop()
+        self._ys.pop()
+        self._sym.pop()
+        self._entities.pop()
 
     def get_row(self, y: int) -> List[str]:
         if 0 <= y < self.height:
-            return self.grid[y][:]
+            return self._cells(y)
         return []
 
     def get_column(self, x: int) -> List[str]:
         if 0 <= x < self.width:
-            return [row[x] for row in self.grid]
+            return list(map(self._symbols.__getitem__, self.grid[x::self.width]))
         return []
 
     def get_region(self, x: int, y: int, width: int, height: int) -> List[List[str]]:
         if (0 <= x < self.width and 0 <= y < self.height and
             x + width <= self.width and y + height <= self.height):
-            return [row[x:x+width] for row in self.grid[y:y+height]]
+            return [self._cells(row_y)[x:x+width] for row_y in range(y, y + height)]
         return []
 
-    def get_all_positions(self) -> List[Tuple[int, int]]:
-        return [(x, y) for y in range(self.height) for x in range(self.width)]
+    def get_all_positions(self) -> Tuple[Tuple[int, int], ...]:
+        return self._all_positions
 
     def get_item_positions(self) -> Tuple[Tuple[int, int], ...]:
-        return tuple(self.items.keys())
+        positions = self._all_positions
+        return tuple(positions[idx] for idx in self._slots)
 
     def get_empty_positions(self) -> List[Tuple[int, int]]:
-        return [
-            (x, y) for x, y in self.get_all_positions()
-            if self.grid[y][x] == self.empty_symbol
-        ]
+        occupied = self._slots
+        return [pos for idx, pos in enumerate(self._all_positions) if idx not in occupied]
 
     def count_items_by_symbol(self) -> Dict[str, int]:
-        symbol_counts = {}
-        for entity in self.items.values():
-            symbol = entity.symbol
-            symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-        return symbol_counts
+        symbols = self._symbols
+        return {symbols[code]: count for code, count in Counter(self._sym).items()}
 
     def move_player(self, dx: int) -> None:
         if not self.player:
             raise ValueError("Гравець не розміщений")
-        new_x = min(max(self.player.x + dx, 0), self.width - 1)
-        if new_x == self.player.x:
-            return
-        self.player.x = new_x
+        new_x = self.player.x + dx
+        if new_x < 0:
+            new_x = 0
+        elif new_x >= self.width:
+            new_x = self.width - 1
+        if new_x != self.player.x:
+            self.player.x = new_x
 
     def drop_items(self, items: Iterable[Entity]) -> List[Entity]:
-        missed: List[Entity] = []
-        new_positions: Dict[Tuple[int, int], Entity] = {}
-        
-        items_list = list(self.items.items())
-        
-        for (x, y), entity in items_list:
-            self.clear_cell(x, y)
-            new_y = y + 1
-            if new_y >= self.height:
-                missed.append(entity)
-                continue
-            entity = type(entity)(x, new_y, entity.symbol, getattr(entity, "points", 0))
-            new_positions[(x, new_y)] = entity
-        
+        grid = self.grid
+        width = self.width
+        empty = self._empty_code
+        last_row = self.height - 1
+        xs, ys, entities = self._xs, self._ys, self._entities
+
+        for x, y in zip(xs, ys):
+            grid[y * width + x] = empty
+
+        player = self.player
+        if player is not None:
+            keep, missed_slots, caught = _advance(xs, ys, last_row, player.x, player.y)
+        else:
+            keep, missed_slots, caught = _advance(xs, ys, last_row, -1, -1)
+        caught_entity = entities[caught] if caught >= 0 else None
+        missed: List[Entity] = [entities[i] for i in missed_slots]
+        if missed:
+            xs = self._xs = array("h", [xs[i] for i in keep])
+            ys = self._ys = array("h", [ys[i] for i in keep])
+            self._sym = bytearray([self._sym[i] for i in keep])
+            entities = self._entities = [entities[i] for i in keep]
+
+        sym = self._sym
+        slots = self._slots
+        slots.clear()
+        by_row = self._by_row = [[] for _ in range(self.height)]
+        by_col = self._by_col = [[] for _ in range(width)]
+        for i, entity in enumerate(entities):
+            x = xs[i]
+            y = ys[i] + 1
+            ys[i] = y
+            entity.y = y
+            idx = y * width + x
+            slots[idx] = i
+            grid[idx] = sym[i]
+            by_row[y].append(idx)
+            by_col[x].append(idx)
+
         for entity in items:
-            new_positions[(entity.x, entity.y)] = entity
-        
-        for (x, y), entity in new_positions.items():
             self._place(entity)
-        
+            if player is not None and entity.x == player.x and entity.y == player.y:
+                caught_entity = entity
+        self.caught = caught_entity
+
         return missed
 
     def get_items_in_row(self, y: int) -> List[Entity]:
-        return [
-            entity for (x, row_y), entity in self.items.items()
-            if row_y == y
-        ]
+        if not 0 <= y < self.height:
+            return []
+        entities, slots = self._entities, self._slots
+        return [entities[slots[idx]] for idx in self._by_row[y]]
 
     def get_items_in_range(self, x_range: Tuple[int, int], y_range: Tuple[int, int]) -> List[Entity]:
-        x_min, x_max = x_range
-        y_min, y_max = y_range
+        x_min, x_max = max(x_range[0], 0), min(x_range[1], self.width)
+        y_min, y_max = max(y_range[0], 0), min(y_range[1], self.height)
+        entities, slots = self._entities, self._slots
+        width = self.width
+        if x_max - x_min < y_max - y_min:
+            return [
+                entities[slots[idx]]
+                for x in range(x_min, x_max) for idx in self._by_col[x]
+                if y_min <= idx // width < y_max
+            ]
         return [
-            entity for (x, y), entity in self.items.items()
-            if x_min <= x < x_max and y_min <= y < y_max
+            entities[slots[idx]]
+            for y in range(y_min, y_max) for idx in self._by_row[y]
+            if x_min <= idx % width < x_max
         ]
 
+    def stamped_rows(self) -> List[List[str]]:
+        rows = [self._cells(y) for y in range(self.height)]
+        if self.player:
+            rows[self.player.y][self.player.x] = self.player.symbol
+        return rows
+
     def render(self) -> str:
-        lines: List[str] = [
-            " ".join([
-                self.player.symbol if (self.player and self.player.x == x and self.player.y == y)
-                else self.grid[y][x]
-                for x in range(self.width)
-            ])
-            for y in range(self.height)
-        ]
-        return "\n".join(lines)
+        return "\n".join([" ".join(row) for row in self.stamped_rows()])
 
     def render_with_borders(self) -> str:
-        border = "+" + "-" * (self.width * 2 - 1) + "+"
-        lines = [border]
-        for y, row in enumerate(self.grid):
-            row_list = list(row)
-            if self.player and self.player.y == y:
-                row_list[self.player.x] = self.player.symbol
-            line = "|" + " ".join(row_list) + "|"
-            lines.append(line)
-        lines.append(border)
-        return "\n".join(lines)
-
+        border = self._border
+        rows = "\n".join(["|" + " ".join(row) + "|" for row in self.stamped_rows()])
+        return f"{border}\n{rows}\n{border}"
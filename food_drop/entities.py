@@ -1,21 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Tuple
-
-
-class SerializableMixin:
-    def to_tuple(self) -> tuple[Any, ...]:
-        return tuple(self.__dict__.values())
 
 
 class NamedMixin:
+    __slots__ = ()
+
     def __init__(self, name: str = "Гравець"):
         self.name = name
 
 
-@dataclass(eq=True)
-class Entity(SerializableMixin):
+@dataclass(eq=False, repr=False, slots=True)
+class Entity:
     x: int
     y: int
     symbol: str = "."
@@ -31,6 +27,8 @@ class Entity(SerializableMixin):
 
 
 class Player(Entity, NamedMixin):
+    __slots__ = ("name", "_score", "_lives")
+
     def __init__(self, x: int, y: int, symbol: str = "U", name: str = "Гравець"):
         Entity.__init__(self, x, y, symbol)
         NamedMixin.__init__(self, name)
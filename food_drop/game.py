@@ -3,15 +3,20 @@ from __future__ import annotations
 import itertools
 import random
 from dataclasses import dataclass
-from typing import Callable, Dict, Generator, Iterable, List, Tuple
+from typing import Callable, Dict, Generator, Iterable, List
 
 from .board import Board
 from .entities import Player
 from .game_state import GameState
 from .items import (
+    KIND_BONUS,
+    KIND_FOOD,
+    KIND_FORBIDDEN,
+    KIND_POWERUP,
     BonusFoodItem,
     FoodItem,
     ForbiddenItem,
+    ItemPool,
     PowerUpItem,
 )
 from .managers import ItemFactory, LevelManager, ScoreManager
@@ -21,13 +26,16 @@ class GameOver(Exception):
     pass
 
 
-@dataclass
+_MISSABLE_KINDS = frozenset((KIND_FOOD, KIND_BONUS))
+
+
+@dataclass(slots=True)
 class DropConfig:
     width: int
     height: int
     lives: int
     allowed_items: Dict[str, int]
-    forbidden_items: set[str]
+    forbidden_items: frozenset[str]
     drop_rate: int = 1
     drop_chance: float = 0.5
     items_config_path: str | None = None
@@ -47,46 +55,46 @@ def make_scoring_rule(bonus_every: int = 5) -> Callable[[int], int]:
 
 def item_stream(
     config: DropConfig,
-    item_factory: ItemFactory | None = None
+    item_factory: ItemFactory | None = None,
+    drop_chance: List[float] | None = None,
+    pool: ItemPool | None = None
 ) -> Generator[List[FoodItem | ForbiddenItem | PowerUpItem | BonusFoodItem], None, None]:
+    random_ = random.random
+    choices = random.choices
+    columns = range(config.width)
+    if drop_chance is None:
+        drop_chance = [config.drop_chance]
+    drop_rate = config.drop_rate
+
     if item_factory and item_factory._config:
-        symbols_and_types: List[Tuple[str, str]] = [
-            (symbol, item_type)
-            for item_type in ("food", "forbidden")
-            if item_type in item_factory._config
-            for symbol in item_factory._config[item_type].keys()
-        ]
+        sample_types = item_factory.sample_item_types
+        create = item_factory.create_random_item
+        can_sample = item_factory.can_sample
         
         while True:
             items: List[FoodItem | ForbiddenItem | PowerUpItem | BonusFoodItem] = []
-            if random.random() < config.drop_chance:
-                for _ in range(config.drop_rate):
-                    if symbols_and_types:
-                        symbol, item_type = random.choice(symbols_and_types)
-                        x = random.randrange(0, config.width)
-                        items.append(item_factory.create_random_item(x, 0, item_type, symbol))
+            if random_() < drop_chance[0] and can_sample:
+                item_types = sample_types(drop_rate)
+                xs = choices(columns, k=drop_rate)
+                for item_type, x in zip(item_types, xs):
+                    items.append(create(x, 0, item_type))
             yield items
     else:
-        symbols = list(config.allowed_items.keys() | config.forbidden_items)
+        if pool is None:
+            pool = ItemPool()
+        get = pool.get
+        forbidden = config.forbidden_items
+        symbols = list(config.allowed_items.keys() | forbidden)
         while True:
             items: List[FoodItem] = []
-            if random.random() < config.drop_chance:
-                for _ in range(config.drop_rate):
-                    symbol = random.choice(symbols)
-                    if symbol in config.forbidden_items:
-                        items.append(ForbiddenItem(
-                            x=random.randrange(0, config.width),
-                            y=0,
-                            symbol=symbol,
-                            damage=999
-                        ))
+            if random_() < drop_chance[0]:
+                picks = choices(symbols, k=drop_rate)
+                xs = choices(columns, k=drop_rate)
+                for symbol, x in zip(picks, xs):
+                    if symbol in forbidden:
+                        items.append(get(ForbiddenItem, x, 0, symbol, 999))
                     else:
-                        items.append(FoodItem(
-                            x=random.randrange(0, config.width),
-                            y=0,
-                            symbol=symbol,
-                            points=1
-                        ))
+                        items.append(get(FoodItem, x, 0, symbol, 1))
             yield items
 
 
@@ -99,6 +107,7 @@ class Game:
         self.score_manager = ScoreManager()
         self.level_manager = LevelManager()
         
+        self._item_pool = ItemPool()
         self.item_factory: ItemFactory | None = None
         if config.items_config_path:
             from .storage import load_items_config
@@ -106,7 +115,12 @@ class Game:
             factory_config: Dict[str, Dict[str, Dict]] = {}
             for item_type, items in items_config.items():
                 factory_config[item_type] = items
-            self.item_factory = ItemFactory(config=factory_config)
+            self.item_factory = ItemFactory(
+                config=factory_config,
+                seed=random.getrandbits(32),
+                pool=self._item_pool,
+                drop_types=("food", "forbidden")
+            )
         
         if config.levels_config_path:
             from .storage import load_levels_config
@@ -120,15 +134,32 @@ class Game:
         start_x = config.width // 2
         self.player = Player(start_x, config.height - 1)
         self.player.lives = config.lives
-        self.board.forbidden = config.forbidden_items
+        self.board.forbidden = frozenset(config.forbidden_items)
         self.board.add_player(self.player)
         self._score_rule = make_scoring_rule()
+        self._drop_chance_level: int | None = None
+        self._drop_chance: List[float] = [config.drop_chance]
+        self._stream = item_stream(
+            config, self.item_factory, self._drop_chance, self._item_pool
+        )
+        self._capture_handlers: Dict[int, Callable[..., None]] = {
+            KIND_FORBIDDEN: self._capture_forbidden,
+            KIND_FOOD: self._capture_food,
+            KIND_BONUS: self._capture_food,
+            KIND_POWERUP: self._capture_powerup,
+        }
         
-        self.score_manager.attach_observer(self._on_score_changed)
-        self.level_manager.attach_observer(self._on_level_up)
+        self.score_manager.attach_observer(self._on_score_changed, events=("score_changed",))
+        self.level_manager.attach_observer(self._on_level_up, events=("level_up",))
     
     def _on_score_changed(self, event: str, data: Dict) -> None:
-        self.game_state.collected_items.append(data.get("item_type", "unknown"))
+        item_counts = data.get("item_counts")
+        if item_counts is None:
+            self.game_state.record_item(data.get("item_type", "unknown"))
+            return
+        for item_type, count in item_counts.items():
+            for _ in range(count):
+                self.game_state.record_item(item_type)
     
     def _on_level_up(self, event: str, data: Dict) -> None:
         self.game_state.level = data.get("level", 1)
@@ -156,52 +187,51 @@ class Game:
         missed: Iterable[FoodItem | ForbiddenItem | PowerUpItem | BonusFoodItem]
     ) -> None:
         for item in missed:
-            if isinstance(item, ForbiddenItem):
-              
-                continue
-
-            if isinstance(item, FoodItem) or isinstance(item, BonusFoodItem):
+            if item.kind in _MISSABLE_KINDS:
                 self.game_state.missed_count += 1
-            
+            self._item_pool.put(item)
+    
+    def _capture_forbidden(self, item: ForbiddenItem, x: int, y: int) -> None:
+        self.player.lives = 0
+        self.board.clear_cell(x, y) 
+        raise GameOver("Caught forbidden item - game over!")
+    
+    def _capture_food(self, item: FoodItem | BonusFoodItem, x: int, y: int) -> None:
+        self._collect_item(item, x, y, "food")
+    
+    def _capture_powerup(self, item: PowerUpItem, x: int, y: int) -> None:
+        self._collect_item(item, x, y, "powerup")
+    
+    def _collect_item(
+        self,
+        item: FoodItem | PowerUpItem | BonusFoodItem,
+        x: int,
+        y: int,
+        item_type: str
+    ) -> None:
+        points = 1
+        item.collect()
+        self.score_manager.add_points(points, item_type)
+        self.player.score = self.score_manager.total_score
+        self.game_state.update_from_player(self.player)
+        self.board.clear_cell(x, y)
+        self._item_pool.put(item)
     
     def _capture_items(self) -> None:
-        pos = (self.player.x, self.player.y) 
-        if pos not in self.board.items:
+        item = self.board.caught
+        if item is None:
             return
         
-        item = self.board.items[pos]
-        
-        if isinstance(item, ForbiddenItem):
-            self.player.lives = 0
-            self.board.clear_cell(*pos) 
-            raise GameOver("Caught forbidden item - game over!")
-        
-        if isinstance(item, FoodItem) or isinstance(item, BonusFoodItem):
-        
-            points = 1
-            item.collect()
-            self.score_manager.add_points(points, "food")
-            self.player.score = self.score_manager.total_score
-            self.game_state.update_from_player(self.player)
-            self.board.clear_cell(*pos)
+        handler = self._capture_handlers.get(item.kind)
+        if handler is not None:
+            handler(item, item.x, item.y)
         
+        self.level_manager.check_level_up_by_items(self.game_state.food_count)
         
-        elif isinstance(item, PowerUpItem):
-            points = 1
-            item.collect()
-            self.score_manager.add_points(points, "powerup")
-            self.player.score = self.score_manager.total_score
-            
-           
-            
-            self.game_state.update_from_player(self.player)
-            self.board.clear_cell(*pos)
-        
-        items_collected = len([i for i in self.game_state.collected_items if i == "food"])
-        self.level_manager.check_level_up_by_items(items_collected)
-        
-        if self.item_factory is None:
+        level = self.level_manager.current_level
+        if self.item_factory is None and level != self._drop_chance_level:
             self.config.drop_chance = self.level_manager.get_drop_chance()
+            self._drop_chance_level = level
     
     def _update_powerups(self) -> None:
         expired: List[str] = []
@@ -243,32 +273,19 @@ class Game:
     ) -> dict:
         move_iter = iter(moves) if moves is not None else itertools.repeat("")
         
-        current_drop_chance = (
+        self._drop_chance[0] = (
             self.level_manager.get_drop_chance() 
             if self.level_manager._config 
             else self.config.drop_chance
         )
         
-        current_config = DropConfig(
-            width=self.config.width,
-            height=self.config.height,
-            lives=self.config.lives,
-            allowed_items=self.config.allowed_items,
-            forbidden_items=self.config.forbidden_items,
-            drop_rate=self.config.drop_rate,
-            drop_chance=current_drop_chance,
-            items_config_path=self.config.items_config_path,
-            levels_config_path=self.config.levels_config_path
-        )
-        
-        stream = item_stream(current_config, self.item_factory)
-        
         for tick in range(max_ticks):
             move = next(move_iter, "")
-            new_items = next(stream)
+            new_items = next(self._stream)
             self._tick(new_items, move)
         
-        stats_tuple = self.score_manager.get_stats_tuple()
+        total_score, multiplier, combo_count, stats = self.score_manager.get_stats_tuple()
+        stats_tuple = (total_score, multiplier, combo_count, dict(stats))
         level_info_tuple = self.level_manager.get_level_info_tuple()
         
         return {
@@ -283,7 +300,7 @@ class Game:
     def get_statistics(self) -> Dict[str, int | float | Dict]:
         return {
             **self.game_state.get_statistics_summary(),
-            "score_manager_stats": self.score_manager.stats,
+            "score_manager_stats": dict(self.score_manager.stats),
             "level": self.level_manager.current_level,
             "items_on_board": len(self.board.items),
             "item_positions": self.board.get_item_positions(),  
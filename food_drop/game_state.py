@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from .entities import Player
 from .items import PowerUpItem
 
+RECENT_ITEMS_CAPACITY = 1024
 
-@dataclass
+ITEM_KINDS: List[str] = ["unknown", "food", "bonus", "powerup", "forbidden"]
+_KIND_IDS: Dict[str, int] = {name: kind for kind, name in enumerate(ITEM_KINDS)}
+
+
+def _kind_id(item_type: str) -> int:
+    kind = _KIND_IDS.get(item_type)
+    if kind is None:
+        if len(ITEM_KINDS) > 127:
+            raise ValueError(f"Too many item kinds to record {item_type!r}")
+        kind = _KIND_IDS[item_type] = len(ITEM_KINDS)
+        ITEM_KINDS.append(item_type)
+    return kind
+
+
+@dataclass(slots=True)
 class GameState:
     
     score: int = 0
@@ -15,24 +31,64 @@ class GameState:
     level: int = 1
     tick_count: int = 0
     missed_count: int = 0
-    collected_items: List[str] = field(default_factory=list)
+    food_count: int = 0
+    collected_count: int = 0
     active_powerups: Dict[str, PowerUpItem] = field(default_factory=dict)
+    _kind_ring: array = field(
+        default_factory=lambda: array("b", bytes(RECENT_ITEMS_CAPACITY)),
+        repr=False,
+        compare=False,
+    )
+    _collected_cache: Tuple[str, ...] | None = field(default=None, repr=False, compare=False)
+    
+    @property
+    def collected_items(self) -> Tuple[str, ...]:
+        return self._collected_tuple()
     
-    def as_tuple(self) -> Tuple[int, int, int, int, int, Tuple[str, ...], Tuple[str, ...]]:
+    def record_item(self, item_type: str) -> None:
+        self._kind_ring[self.collected_count % RECENT_ITEMS_CAPACITY] = _kind_id(item_type)
+        self.collected_count += 1
+        self._collected_cache = None
+        if item_type == "food":
+            self.food_count += 1
+    
+    def _collected_tuple(self) -> Tuple[str, ...]:
+        if self._collected_cache is None:
+            self._collected_cache = tuple(self.get_recent_items(RECENT_ITEMS_CAPACITY))
+        return self._collected_cache
+    
+    def _reset_collected(self, items: Iterable[str], start: int = 0) -> None:
+        self.collected_count = max(start, 0)
+        self.food_count = 0
+        self._collected_cache = None
+        for item_type in items:
+            self.record_item(item_type)
+    
+    def as_tuple(
+        self
+    ) -> Tuple[int, int, int, int, int, Tuple[str, ...], Tuple[str, ...], int, int]:
         return (
             self.score,
             self.lives,
             self.level,
             self.tick_count,
             self.missed_count,
-            tuple(self.collected_items),
-            tuple(self.active_powerups.keys())
+            self._collected_tuple(),
+            tuple(self.active_powerups.keys()),
+            self.collected_count,
+            self.food_count
         )
     
     def from_tuple(self, data: Tuple) -> None:
         (self.score, self.lives, self.level, self.tick_count, 
-         self.missed_count, items, powerups) = data
-        self.collected_items = list(items)
+         self.missed_count, items, powerups) = data[:7]
+        items = list(items)
+        if len(data) > 7:
+            collected_count, food_count = data[7:9]
+            self._reset_collected(items, collected_count - len(items))
+            self.food_count = food_count
+        else:
+            self._reset_collected(items)
     
     def to_dict(self) -> Dict:
         return {
@@ -41,7 +97,9 @@ class GameState:
             "level": self.level,
             "tick_count": self.tick_count,
             "missed_count": self.missed_count,
-            "collected_items": self.collected_items[:],  
+            "food_count": self.food_count,
+            "collected_count": self.collected_count,
+            "collected_items": self._collected_tuple(),
             "active_powerups": list(self.active_powerups.keys())
         }
     
@@ -51,26 +109,34 @@ class GameState:
         self.level = data.get("level", 1)
         self.tick_count = data.get("tick_count", 0)
         self.missed_count = data.get("missed_count", 0)
-        self.collected_items = data.get("collected_items", [])
+        items = list(data.get("collected_items", []))
+        self._reset_collected(items, data.get("collected_count", len(items)) - len(items))
+        self.food_count = data.get("food_count", self.food_count)
     
     def update_from_player(self, player: Player) -> None:
         self.score = player.score
         self.lives = player.lives
     
     def get_recent_items(self, count: int = 10) -> List[str]:
-        return self.collected_items[-count:] if self.collected_items else []
+        total = self.collected_count
+        count = min(count, total, RECENT_ITEMS_CAPACITY)
+        ring = self._kind_ring
+        return [
+            ITEM_KINDS[ring[i % RECENT_ITEMS_CAPACITY]]
+            for i in range(total - count, total)
+        ]
     
     def get_statistics_summary(self) -> Dict[str, int | float]:
+        collected = self.collected_count
         return {
             "total_score": self.score,
             "remaining_lives": self.lives,
             "current_level": self.level,
-            "items_collected": len(self.collected_items),
+            "items_collected": collected,
             "items_missed": self.missed_count,
             "success_rate": (
-                len(self.collected_items) / (len(self.collected_items) + self.missed_count)
-                if (len(self.collected_items) + self.missed_count) > 0
+                collected / (collected + self.missed_count)
+                if (collected + self.missed_count) > 0
                 else 0.0
             )
         }
-
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Iterable
+import sys
+from typing import Iterable, List, TextIO
 
 from .board import Board
 
@@ -9,16 +10,43 @@ def print_board(board: Board) -> None:
     header = "   " + " ".join(str(x) for x in range(board.width))
     print(header)
     for y in range(board.height):
-        row_symbols = []
-        for x in range(board.width):
-            symbol = board.grid[y][x]
-            if board.player and board.player.x == x and board.player.y == y:
-                symbol = board.player.symbol
-            row_symbols.append(symbol)
+        row_symbols = board.get_row(y)
+        if board.player and board.player.y == y:
+            row_symbols[board.player.x] = board.player.symbol
         line = f"{y}  " + " ".join(row_symbols)
         print(line)
 
 
+class TerminalRenderer:
+    def __init__(self, stream: TextIO | None = None):
+        self._stream = stream
+        self._width = -1
+        self._header = ""
+        self._prev_rows: List[str] = []
+        self._prev_lines: List[str] = []
+
+    def render(self, board: Board, force: bool = False) -> bool:
+        if board.width != self._width:
+            self._width = board.width
+            self._header = "   " + " ".join(str(x) for x in range(board.width))
+            self._prev_rows = []
+            self._prev_lines = []
+
+        rows = board.stamped_rows()
+        prev_rows, prev_lines = self._prev_rows, self._prev_lines
+        if rows == prev_rows and not force:
+            return False
+        known = len(prev_rows)
+        lines = [
+            prev_lines[y] if y < known and prev_rows[y] == row else f"{y}  " + " ".join(row)
+            for y, row in enumerate(rows)
+        ]
+        self._prev_rows, self._prev_lines = rows, lines
+
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(self._header + "\n" + "\n".join(lines) + "\n")
+        return True
+
+
 def describe_actions(actions: Iterable[str]) -> str:
     return ", ".join(actions)
-
@@ -1,156 +1,186 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, Tuple, Type, TypeVar
 
 from .entities import Entity
 
+ItemT = TypeVar("ItemT", bound="Item")
+
+KIND_FOOD = 0
+KIND_FORBIDDEN = 1
+KIND_POWERUP = 2
+KIND_BONUS = 3
+
+
+class Item(Entity):
+    __slots__ = (
+        "kind",
+        "_is_collected",
+        "_points",
+        "_damage",
+        "_duration",
+        "_timer",
+        "_name",
+        "effect_type",
+        "_bonus_multiplier",
+    )
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        symbol: str,
+        kind: int = KIND_FOOD,
+        points: int = 0,
+        damage: int = 0,
+        duration: int = 0,
+        name: str = "",
+        effect_type: str = "",
+        bonus_multiplier: float = 1.0
+    ):
+        self.x = x
+        self.y = y
+        self.symbol = symbol
+        self.kind = kind
+        self._is_collected = False
+        self._points = points
+        self._damage = damage
+        self._duration = duration
+        self._timer = duration
+        self._name = name
+        self.effect_type = effect_type
+        self._bonus_multiplier = bonus_multiplier
 
-class CollectibleMixin:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._is_collected: bool = False
-    
     @property
     def is_collected(self) -> bool:
         return self._is_collected
-    
+
     def collect(self) -> None:
         self._is_collected = True
 
-
-class ScorableMixin:
-    def __init__(self, points: int = 0, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._points: int = points
-    
     @property
     def points(self) -> int:
         return self._points
-    
+
     @points.setter
     def points(self, value: int) -> None:
         if value < 0:
             raise ValueError("Points cannot be negative")
         self._points = value
 
-
-class DangerousMixin:
-    def __init__(self, damage: int = 1, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._damage: int = damage
-    
     @property
     def damage(self) -> int:
         return self._damage
-    
+
     @damage.setter
     def damage(self, value: int) -> None:
         if value < 0:
             raise ValueError("Damage cannot be negative")
         self._damage = value
 
-
-class TimedMixin:
-    def __init__(self, duration: int = 5, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._duration: int = duration
-        self._timer: int = duration
-    
     @property
     def duration(self) -> int:
         return self._duration
-    
+
     @property
     def timer(self) -> int:
         return self._timer
-    
+
     @timer.setter
     def timer(self, value: int) -> None:
         self._timer = max(0, value)
-    
+
     def tick(self) -> bool:
         self._timer -= 1
         return self._timer > 0
 
-
-class NamedMixin:
-    def __init__(self, name: str = "", *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._name: str = name
-    
     @property
     def name(self) -> str:
         return self._name if self._name else self.symbol
 
 
-@dataclass(eq=True)
-class FoodItem(Entity, CollectibleMixin, ScorableMixin, NamedMixin):
+class FoodItem(Item):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, symbol: str, points: int = 1, name: str = ""):
-        Entity.__init__(self, x, y, symbol)
-        CollectibleMixin.__init__(self)
-        ScorableMixin.__init__(self, points)
-        NamedMixin.__init__(self, name)
-    
+        Item.__init__(self, x, y, symbol, KIND_FOOD, points=points, name=name)
+
     def as_tuple(self) -> Tuple[int, int, str, int]:
         return (self.x, self.y, self.symbol, self.points)
 
 
-@dataclass(eq=True)
-class ForbiddenItem(Entity, CollectibleMixin, DangerousMixin, NamedMixin):
+class ForbiddenItem(Item):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, symbol: str, damage: int = 999, name: str = ""):
-        Entity.__init__(self, x, y, symbol)
-        CollectibleMixin.__init__(self)
-        DangerousMixin.__init__(self, damage)
-        NamedMixin.__init__(self, name)
-    
+        Item.__init__(self, x, y, symbol, KIND_FORBIDDEN, damage=damage, name=name)
+
     def as_tuple(self) -> Tuple[int, int, str, int]:
         return (self.x, self.y, self.symbol, self.damage)
 
 
-@dataclass(eq=True)
-class PowerUpItem(Entity, CollectibleMixin, ScorableMixin, TimedMixin, NamedMixin):
+class PowerUpItem(Item):
+    __slots__ = ()
+
     def __init__(
-        self, 
-        x: int, 
-        y: int, 
-        symbol: str, 
+        self,
+        x: int,
+        y: int,
+        symbol: str,
         points: int = 5,
         duration: int = 10,
         name: str = "",
         effect_type: str = "speed"
     ):
-        Entity.__init__(self, x, y, symbol)
-        CollectibleMixin.__init__(self)
-        ScorableMixin.__init__(self, points)
-        TimedMixin.__init__(self, duration)
-        NamedMixin.__init__(self, name)
-        self.effect_type: str = effect_type
-    
+        Item.__init__(
+            self, x, y, symbol, KIND_POWERUP,
+            points=points, duration=duration, name=name, effect_type=effect_type
+        )
+
     def as_tuple(self) -> Tuple[int, int, str, int, int, str]:
         return (self.x, self.y, self.symbol, self.points, self.duration, self.effect_type)
 
 
-@dataclass(eq=True)
-class BonusFoodItem(FoodItem, ScorableMixin):
-    
-    
+class BonusFoodItem(FoodItem):
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, symbol: str, points: int = 10, name: str = ""):
-       
-        Entity.__init__(self, x, y, symbol)
-        CollectibleMixin.__init__(self)
-        ScorableMixin.__init__(self, points)
-        NamedMixin.__init__(self, name)
-        self._bonus_multiplier: float = 1.5
-    
+        Item.__init__(
+            self, x, y, symbol, KIND_BONUS,
+            points=points, name=name, bonus_multiplier=1.5
+        )
+
     @property
     def bonus_multiplier(self) -> float:
         return self._bonus_multiplier
-    
+
     @property
     def effective_points(self) -> int:
         return int(self.points * self._bonus_multiplier)
-    
+
     def as_tuple(self) -> Tuple[int, int, str, int, float]:
         return (self.x, self.y, self.symbol, self.points, self._bonus_multiplier)
 
+
+class ItemPool:
+    def __init__(self, capacity: int = 256):
+        self._capacity = capacity
+        self._free: Dict[type, Deque[Item]] = {}
+
+    def get(self, item_class: Type[ItemT], *args: Any, **kwargs: Any) -> ItemT:
+        free = self._free.get(item_class)
+        if free:
+            item = free.pop()
+            item_class.__init__(item, *args, **kwargs)
+            return item
+        return item_class(*args, **kwargs)
+
+    def put(self, item: Item) -> None:
+        free = self._free.get(type(item))
+        if free is None:
+            free = self._free[type(item)] = deque(maxlen=self._capacity)
+        free.append(item)
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import random
-from typing import Callable, Dict, List, Tuple, Type
+from array import array
+from collections import Counter
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Type
 
+from ._jit import score_batch
 from .entities import Entity
 from .items import (
     BonusFoodItem,
     FoodItem,
     ForbiddenItem,
+    ItemPool,
     PowerUpItem,
-    NamedMixin,
-    ScorableMixin,
 )
 
 
+_EMPTY_PAYLOAD: Mapping = MappingProxyType({})
+
+
 class FactoryMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -32,10 +39,11 @@ class ConfigurableMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._config: Dict = {}
+        self._config_view: Mapping = MappingProxyType(self._config)
     
     @property
-    def config(self) -> Dict:
-        return self._config.copy()
+    def config(self) -> Mapping:
+        return self._config_view
     
     def load_config(self, config: Dict) -> None:
         self._config.update(config)
@@ -55,19 +63,66 @@ class RandomizableMixin:
 
 
 class ItemFactory(FactoryMixin, ConfigurableMixin, RandomizableMixin):
-    def __init__(self, config: Dict | None = None, seed: int | None = None):
+    def __init__(
+        self,
+        config: Dict | None = None,
+        seed: int | None = None,
+        pool: ItemPool | None = None,
+        drop_types: Iterable[str] | None = None
+    ):
         FactoryMixin.__init__(self)
         ConfigurableMixin.__init__(self)
         RandomizableMixin.__init__(self, seed)
+        self.pool = pool if pool is not None else ItemPool()
+        self._drop_types = tuple(drop_types) if drop_types is not None else None
+        self._config_keys: Tuple[str, ...] = ()
+        self._type_population: Tuple[str, ...] = ()
+        self._type_cum_weights: Tuple[float, ...] = ()
+        self._symbol_keys: Dict[str, Tuple[str, ...]] = {}
         
         self.register("food", FoodItem)
         self.register("forbidden", ForbiddenItem)
         self.register("powerup", PowerUpItem)
         self.register("bonus", BonusFoodItem)
         
+        get = self.pool.get
+        self._builders: Dict[str, Callable[[int, int, str, Dict], Entity]] = {
+            "food": lambda x, y, s, d: get(FoodItem, x, y, s, 1, d.get("name", "")),
+            "forbidden": lambda x, y, s, d: get(
+                ForbiddenItem, x, y, s, d.get("damage", 999), d.get("name", "")
+            ),
+            "powerup": lambda x, y, s, d: get(
+                PowerUpItem, x, y, s,
+                d.get("points", 5), d.get("duration", 10), d.get("name", ""), d.get("effect", "speed")
+            ),
+            "bonus": lambda x, y, s, d: get(BonusFoodItem, x, y, s, 1, d.get("name", "")),
+        }
+        
         if config:
             self.load_config(config)
     
+    def load_config(self, config: Dict) -> None:
+        super().load_config(config)
+        self._config_keys = tuple(self._config)
+        self._symbol_keys = {
+            item_type: tuple(symbol for symbol in items_of_type if symbol != "_weight")
+            for item_type, items_of_type in self._config.items()
+        }
+        drop_types = self._drop_types if self._drop_types is not None else self._config_keys
+        self._type_population = tuple(
+            item_type for item_type in drop_types if self._symbol_keys.get(item_type)
+        )
+        self._type_cum_weights = tuple(accumulate(
+            float(self._config[item_type].get("_weight", 1.0)) for item_type in self._type_population
+        ))
+    
+    @property
+    def can_sample(self) -> bool:
+        return bool(self._type_population) and self._type_cum_weights[-1] > 0
+    
+    def sample_item_types(self, n: int) -> List[str]:
+        return self._rng.choices(self._type_population, cum_weights=self._type_cum_weights, k=n)
+    
     def create_random_item(
         self, 
         x: int, 
@@ -75,44 +130,33 @@ class ItemFactory(FactoryMixin, ConfigurableMixin, RandomizableMixin):
         item_type: str | None = None,
         symbol: str | None = None
     ) -> Entity:
-        if not self._config:
+        cfg = self._config
+        if not cfg:
             item_type = item_type or "food"
             symbol = symbol or "?"
             return self.create(item_type, x, y, symbol, 1)
         
+        rng_choice = self._rng.choice
         if item_type is None:
-            item_type = self._rng.choice(list(self._config.keys()))
+            item_type = rng_choice(self._config_keys)
         
-        items_of_type = self._config.get(item_type, {})
+        items_of_type = cfg.get(item_type, _EMPTY_PAYLOAD)
         
-        if symbol is None or symbol not in items_of_type:
-            if not items_of_type:
+        if symbol is None or symbol == "_weight" or symbol not in items_of_type:
+            symbols = self._symbol_keys.get(item_type)
+            if not symbols:
                 symbol = "?"
-                item_data = {}
+                item_data = _EMPTY_PAYLOAD
             else:
-                symbol = self._rng.choice(list(items_of_type.keys()))
+                symbol = rng_choice(symbols)
                 item_data = items_of_type[symbol]
         else:
             item_data = items_of_type[symbol]
         
-        name = item_data.get("name", "")
-        
-        if item_type == "food":
-            points = 1
-            return FoodItem(x, y, symbol, points, name)
-        elif item_type == "forbidden":
-            damage = item_data.get("damage", 999)
-            return ForbiddenItem(x, y, symbol, damage, name)
-        elif item_type == "powerup":
-            points = item_data.get("points", 5)
-            duration = item_data.get("duration", 10)
-            effect = item_data.get("effect", "speed")
-            return PowerUpItem(x, y, symbol, points, duration, name, effect)
-        elif item_type == "bonus":
-            points = 1
-            return BonusFoodItem(x, y, symbol, points, name)
-        else:
-            return self.create(item_type, x, y, symbol)
+        builder = self._builders.get(item_type)
+        if builder is not None:
+            return builder(x, y, symbol, item_data)
+        return self.create(item_type, x, y, symbol)
 
 
 class TrackableMixin:
@@ -121,10 +165,11 @@ class TrackableMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._stats: Dict[str, int] = {}
+        self._stats_view: Mapping[str, int] = MappingProxyType(self._stats)
     
     @property
-    def stats(self) -> Dict[str, int]:
-        return self._stats.copy()
+    def stats(self) -> Mapping[str, int]:
+        return self._stats_view
     
     def increment_stat(self, key: str, amount: int = 1) -> None:
         self._stats[key] = self._stats.get(key, 0) + amount
@@ -136,24 +181,44 @@ class TrackableMixin:
 class ObservableMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._observers: List[Callable[[str, Dict], None]] = []
-    
-    def attach_observer(self, observer: Callable[[str, Dict], None]) -> None:
-        if observer not in self._observers:
-            self._observers.append(observer)
-    
-    def notify_observers(self, event: str, data: Dict | None = None) -> None:
-        for observer in self._observers:
-            observer(event, data or {})
+        self._observers_by_event: Dict[str, Dict[Callable[[str, Dict], None], int]] = {}
+    
+    def attach_observer(
+        self,
+        observer: Callable[[str, Dict], None],
+        events: Iterable[str] = ("*",),
+        level: int = 0
+    ) -> None:
+        for event in events:
+            self._observers_by_event.setdefault(event, {}).setdefault(observer, level)
+    
+    def has_observers(self, event: str) -> bool:
+        by_event = self._observers_by_event
+        return bool(by_event.get(event) or by_event.get("*"))
+    
+    def notify_observers(self, event: str, data: Dict | None = None, level: int = 0) -> None:
+        by_event = self._observers_by_event
+        if not by_event:
+            return
+        payload = data if data is not None else _EMPTY_PAYLOAD
+        for observers in (by_event.get(event), by_event.get("*")):
+            if not observers:
+                continue
+            for observer, min_level in observers.items():
+                if min_level <= level:
+                    observer(event, payload)
 
 
 class ScoreManager(TrackableMixin, ObservableMixin):
+    combo_milestone: int = 5
+    
     def __init__(self):
         TrackableMixin.__init__(self)
         ObservableMixin.__init__(self)
         self._total_score: int = 0
         self._multiplier: float = 1.0
         self._combo_count: int = 0
+        self._stat_key_cache: Dict[str, str] = {}
     
     @property
     def total_score(self) -> int:
@@ -170,19 +235,79 @@ class ScoreManager(TrackableMixin, ObservableMixin):
     def add_points(self, points: int, item_type: str = "unknown") -> None:
         effective_points = int(points * self._multiplier)
         self._total_score += effective_points
-        self.increment_stat(f"{item_type}_collected", 1)
-        self.increment_stat("total_points", effective_points)
+        
+        key = self._stat_key_cache.get(item_type)
+        if key is None:
+            key = self._stat_key_cache[item_type] = item_type + "_collected"
+        stats = self._stats
+        stats[key] = stats.get(key, 0) + 1
+        stats["total_points"] = stats.get("total_points", 0) + effective_points
         
         if effective_points > 0:
             self._combo_count += 1
         else:
             self._combo_count = 0
         
+        if not self.has_observers("score_changed"):
+            return
+        milestone = self._combo_count > 0 and self._combo_count % self.combo_milestone == 0
         self.notify_observers("score_changed", {
             "points": effective_points,
             "total": self._total_score,
             "item_type": item_type
-        })
+        }, level=1 if milestone else 0)
+    
+    def add_points_batch(
+        self,
+        points: Sequence[int],
+        multipliers: Sequence[float] | None = None,
+        item_types: Sequence[str] | str = "unknown"
+    ) -> int:
+        count = len(points)
+        if multipliers is None:
+            mults = array("d", [self._multiplier]) * count
+        elif len(multipliers) != count:
+            raise ValueError("points and multipliers must have the same length")
+        else:
+            mults = array("d", multipliers)
+        effective = array("q", bytes(8 * count))
+        batch_total = score_batch(array("q", points), mults, effective)
+        self._total_score += batch_total
+        
+        if isinstance(item_types, str):
+            item_counts = {item_types: count} if count else {}
+        else:
+            if len(item_types) != count:
+                raise ValueError("points and item_types must have the same length")
+            item_counts = Counter(item_types)
+        stats = self._stats
+        cache = self._stat_key_cache
+        for item_type, type_count in item_counts.items():
+            key = cache.get(item_type)
+            if key is None:
+                key = cache[item_type] = item_type + "_collected"
+            stats[key] = stats.get(key, 0) + type_count
+        stats["total_points"] = stats.get("total_points", 0) + batch_total
+        
+        combo = self._combo_count
+        milestone_every = self.combo_milestone
+        milestone = False
+        for value in effective:
+            if value > 0:
+                combo += 1
+                if combo % milestone_every == 0:
+                    milestone = True
+            else:
+                combo = 0
+        self._combo_count = combo
+        
+        if count and self.has_observers("score_changed"):
+            self.notify_observers("score_changed", {
+                "points": batch_total,
+                "total": self._total_score,
+                "item_counts": dict(item_counts)
+            }, level=1 if milestone else 0)
+        return batch_total
     
     def set_multiplier(self, multiplier: float) -> None:
         self._multiplier = max(1.0, multiplier)
@@ -191,8 +316,8 @@ class ScoreManager(TrackableMixin, ObservableMixin):
     def reset_combo(self) -> None:
         self._combo_count = 0
     
-    def get_stats_tuple(self) -> Tuple[int, float, int, Dict[str, int]]:
-        return (self._total_score, self._multiplier, self._combo_count, self._stats.copy())
+    def get_stats_tuple(self) -> Tuple[int, float, int, Mapping[str, int]]:
+        return (self._total_score, self._multiplier, self._combo_count, self._stats_view)
 
 
 class LevelManager(ConfigurableMixin, ObservableMixin):
@@ -202,7 +327,10 @@ class LevelManager(ConfigurableMixin, ObservableMixin):
         self._current_level: int = 1
         self._items_threshold: int = 0 
         self._items_collected_for_level: int = 0  
-        self._levels_config: Dict = {}
+        self._levels_config: Dict[int, Dict] = {}
+        self._items_required: List[int] = []
+        self._previous_levels_total: int = 0
+        self._drop_chance_cache: float | None = None
         
         if config:
             self.load_config(config)
@@ -221,19 +349,38 @@ class LevelManager(ConfigurableMixin, ObservableMixin):
     
     def load_config(self, config: Dict) -> None:
         super().load_config(config)
-        self._levels_config = config.get("levels", {})
+        self._levels_config = {
+            int(level_num): level_config
+            for level_num, level_config in config.get("levels", {}).items()
+            if str(level_num).isdigit()
+        }
+        self._items_required = self._build_items_required()
+        self._previous_levels_total = sum(
+            self._required_items(level_num) for level_num in range(1, self._current_level)
+        )
         self._update_threshold_for_current_level()
     
+    def _build_items_required(self) -> List[int]:
+        return [
+            self._levels_config.get(level_num, _EMPTY_PAYLOAD).get("items_required", 5 + (level_num - 1) * 2)
+            for level_num in range(1, max(self._levels_config, default=0) + 1)
+        ]
+    
+    def _required_items(self, level_num: int) -> int:
+        if level_num <= len(self._items_required):
+            return self._items_required[level_num - 1]
+        return 5 + (level_num - 1) * 2
+    
     def _update_threshold_for_current_level(self) -> None:
-        level_config = self._levels_config.get(str(self._current_level), {})
-       
-        self._items_threshold = level_config.get("items_required", 5 + (self._current_level - 1) * 2)
+        self._items_threshold = self._required_items(self._current_level)
         self._items_collected_for_level = 0
+        self._drop_chance_cache = None
     
     def check_level_up_by_items(self, total_items_collected: int) -> bool:
-        items_on_current_level = total_items_collected - self._get_total_items_for_previous_levels()
+        items_on_current_level = total_items_collected - self._previous_levels_total
         
         if items_on_current_level >= self._items_threshold:
+            self._previous_levels_total += self._required_items(self._current_level)
             self._current_level += 1
             self._update_threshold_for_current_level()
             self.notify_observers("level_up", {
@@ -244,12 +391,7 @@ class LevelManager(ConfigurableMixin, ObservableMixin):
         return False
     
     def _get_total_items_for_previous_levels(self) -> int:
-        total = 0
-        for level_num in range(1, self._current_level):
-            level_config = self._levels_config.get(str(level_num), {})
-            items_required = level_config.get("items_required", 5 + (level_num - 1) * 2)
-            total += items_required
-        return total
+        return self._previous_levels_total
     
     def get_items_collected_on_current_level(self, total_items_collected: int) -> int:
         return total_items_collected - self._get_total_items_for_previous_levels()
@@ -257,14 +399,19 @@ class LevelManager(ConfigurableMixin, ObservableMixin):
     def check_level_up(self, score: int) -> bool:
         return False
     
+    def _get_level_config_view(self) -> Mapping:
+        return self._levels_config.get(self._current_level, _EMPTY_PAYLOAD)
+    
     def get_level_config(self) -> Dict:
-        return self._levels_config.get(str(self._current_level), {}).copy()
+        return self._get_level_config_view().copy()
     
     def get_drop_chance(self) -> float:
-        level_config = self.get_level_config()
+        if self._drop_chance_cache is not None:
+            return self._drop_chance_cache
         base_chance = self._config.get("base_drop_chance", 0.3)
-        level_chance = level_config.get("drop_chance", base_chance)
-        return min(level_chance + (self._current_level - 1) * 0.05, 0.9)
+        level_chance = self._get_level_config_view().get("drop_chance", base_chance)
+        self._drop_chance_cache = min(level_chance + (self._current_level - 1) * 0.05, 0.9)
+        return self._drop_chance_cache
     
     def get_level_info_tuple(self) -> Tuple[int, int, Dict]:
         return (self._current_level, self._items_threshold, self.get_level_config())
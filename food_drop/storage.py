@@ -1,103 +1,169 @@
 from __future__ import annotations
 
-import json
-import pickle
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
+try:
+    import orjson
+except ImportError:
+    import json
 
-def load_config_from_text(path: str) -> Dict[str, str]:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode("utf-8"))
+else:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+
+_split_fields = re.compile(r"\s*:\s*").split
+_SCORED_ITEM_TYPES = frozenset(("food", "bonus", "powerup"))
+
+
+_config_cache_clears: List[Callable[[], None]] = []
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _cached_by_mtime(loader: Callable[[str], Dict]) -> Callable[[str], Mapping]:
+    @functools.lru_cache(maxsize=16)
+    def load_cached(path: str, mtime_ns: int) -> Mapping:
+        return _freeze(loader(path))
+
+    @functools.wraps(loader)
+    def load(path: str) -> Mapping:
+        return load_cached(path, Path(path).stat().st_mtime_ns)
+
+    _config_cache_clears.append(load_cached.cache_clear)
+    return load
+
+
+def clear_config_cache() -> None:
+    for cache_clear in _config_cache_clears:
+        cache_clear()
+
+
+@_cached_by_mtime
+def load_config_from_text(path: str) -> Mapping[str, str]:
     config: Dict[str, str] = {}
-    for line in Path(path).read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", maxsplit=1)
-        config[key.strip()] = value.strip()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", maxsplit=1)
+            config[key.strip()] = value.strip()
     return config
 
 
 def save_scores_text(path: str, *scores: Tuple[str, int]) -> None:
-    lines = [f"{name}:{points}" for name, points in scores]
-    Path(path).write_text("\n".join(lines), encoding="utf-8")
+    buffer = bytearray()
+    extend = buffer.extend
+    for name, points in scores:
+        extend(name.encode("utf-8"))
+        extend(b":")
+        extend(str(points).encode("ascii"))
+        extend(b"\n")
+    Path(path).write_bytes(buffer)
 
 
 def load_scores_text(path: str) -> Dict[str, int]:
-    scores: Dict[str, int] = {}
-    for line in Path(path).read_text(encoding="utf-8").splitlines():
-        if ":" not in line:
-            continue
-        name, value = line.split(":", maxsplit=1)
-        scores[name] = int(value)
-    return scores
+    with open(path, encoding="utf-8") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        pairs = dict(line.rstrip("\r\n").split(":", 1) for line in f if ":" in line)
+    return {name: int(value) for name, value in pairs.items()}
 
 
 def save_state_binary(path: str, state: dict) -> None:
-    Path(path).write_bytes(pickle.dumps(state))
+    Path(path).write_bytes(_dumps(state))
 
 
 def load_state_binary(path: str) -> dict:
-    return pickle.loads(Path(path).read_bytes())
+    return _loads(Path(path).read_bytes())
 
 
 def save_state_json(path: str, state: dict) -> None:
-    Path(path).write_text(json.dumps(state, indent=2), encoding="utf-8")
+    Path(path).write_bytes(_dumps(state))
+
+
+def _to_int(value: str, default: int) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _to_float(value: str, default: float) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return default
 
 
-def load_items_config(path: str) -> Dict[str, Dict[str, str | int]]:
+@_cached_by_mtime
+def load_items_config(path: str) -> Mapping[str, Dict[str, Dict[str, str | int]]]:
     items_config: Dict[str, Dict[str, Dict[str, str | int]]] = {}
+    split_fields = _split_fields
+    to_int = _to_int
     
-    for line in Path(path).read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        
-        parts = line.split(":")
-        if len(parts) < 4:
-            continue
-        
-        item_type = parts[0].strip()
-        symbol = parts[1].strip()
-        name = parts[2].strip()
-        points_or_damage = int(parts[3].strip()) if parts[3].strip().isdigit() else 0
-        duration = int(parts[4].strip()) if len(parts) > 4 and parts[4].strip().isdigit() else 0
-        effect = parts[5].strip() if len(parts) > 5 else "normal"
-        
-        if item_type not in items_config:
-            items_config[item_type] = {}
-        
-        items_config[item_type][symbol] = {
-            "name": name,
-            "symbol": symbol,
-            "points" if item_type in ("food", "bonus", "powerup") else "damage": points_or_damage,
-            "duration": duration,
-            "effect": effect
-        }
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            
+            parts = split_fields(line)
+            if len(parts) < 4:
+                continue
+            
+            item_type, symbol, name = parts[0], parts[1], parts[2]
+            value_key = "points" if item_type in _SCORED_ITEM_TYPES else "damage"
+            
+            items_config.setdefault(item_type, {})[symbol] = {
+                "name": name,
+                "symbol": symbol,
+                value_key: to_int(parts[3], 0),
+                "duration": to_int(parts[4], 0) if len(parts) > 4 else 0,
+                "effect": parts[5] if len(parts) > 5 else "normal"
+            }
     
     return items_config
 
 
-def load_levels_config(path: str) -> Dict[str, Dict[str, int | float | str]]:
-    levels_config: Dict[str, Dict[str, int | float | str]] = {}
+@_cached_by_mtime
+def load_levels_config(path: str) -> Mapping[int, Dict[str, int | float | str]]:
+    levels_config: Dict[int, Dict[str, int | float | str]] = {}
+    split_fields = _split_fields
     
-    for line in Path(path).read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        
-        parts = line.split(":")
-        if len(parts) < 3:
-            continue
-        
-        level = parts[0].strip()
-        items_required = int(parts[1].strip()) if parts[1].strip().isdigit() else 5
-        drop_chance = float(parts[2].strip()) if parts[2].strip().replace(".", "").isdigit() else 0.3
-        description = parts[3].strip() if len(parts) > 3 else f"Level {level}"
-        
-        levels_config[level] = {
-            "items_required": items_required,
-            "drop_chance": drop_chance,
-            "description": description
-        }
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            
+            parts = split_fields(line)
+            if len(parts) < 3:
+                continue
+            
+            level = _to_int(parts[0], 0)
+            if level <= 0:
+                continue
+            levels_config[level] = {
+                "items_required": _to_int(parts[1], 5),
+                "drop_chance": _to_float(parts[2], 0.3),
+                "description": parts[3] if len(parts) > 3 else f"Level {level}"
+            }
     
-    return levels_config
\ No newline at end of file
+    return levels_config
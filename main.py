@@ -4,10 +4,11 @@ from pathlib import Path
 
 from food_drop import Game, GameOver, load_config_from_text
 from food_drop.game import DropConfig
-from food_drop.io_utils import print_board
-from food_drop.storage import load_scores_text, save_scores_text, save_state_binary
+from food_drop.io_utils import TerminalRenderer
+from food_drop.storage import save_scores_text, save_state_binary
 
 HIGH_SCORE = 0
+_ALLOWED_KEYS = frozenset({"A", "D", "", "Q"})
 
 
 def parse_config(path: str) -> DropConfig:
@@ -20,7 +21,7 @@ def parse_config(path: str) -> DropConfig:
         )
     }
    
-    forbidden = {item for item in cfg.get("forbidden", "").split(",") if item}
+    forbidden = frozenset(item for item in cfg.get("forbidden", "").split(",") if item)
     return DropConfig(
         width=int(cfg.get("width", 7)),
         height=int(cfg.get("height", 6)),
@@ -34,13 +35,9 @@ def parse_config(path: str) -> DropConfig:
     )
 
 
-def input_move(prompt: str, /, *, allowed=("A", "D", "", "Q")) -> str:
-    def normalize(s):
-        return s.strip().upper()
-
+def input_move(prompt: str, /, *, allowed=_ALLOWED_KEYS) -> str:
     while True:
-        raw = input(prompt)
-        move = normalize(raw)
+        move = input(prompt).strip().upper()
         if move == "":
             return ""
         if move in allowed:
@@ -54,6 +51,7 @@ def demo_game() -> None:
     config_path = Path("config/sample_config.txt")
     config = parse_config(str(config_path))
     game = Game(config)
+    renderer = TerminalRenderer()
 
     print("=== Food Drop ===")
     print("Керування: A – вліво, D – вправо, Enter – стояти на місці, Q – вийти.")
@@ -78,13 +76,14 @@ def demo_game() -> None:
     while True:
         tick += 1
         print(f"\nХід #{tick}")
-        items_collected = len([i for i in game.game_state.collected_items if i == "food"])
+        items_collected = game.game_state.food_count
         items_needed = game.level_manager.items_threshold
         items_on_level = game.level_manager.get_items_collected_on_current_level(items_collected)
         print(f"Рівень: {game.level}")
         print(f"Зібрано предметів: {items_collected} (на рівні: {items_on_level}/{items_needed})")
         print(f"Пропущено предметів: {game.game_state.missed_count}/3")
-        print_board(game.board)
+        if not renderer.render(game.board):
+            print("Поле без змін.")
 
         move_key = input_move("Ваш хід (A/D/Enter/Q): ")
         if move_key == "Q":
@@ -102,7 +101,7 @@ def demo_game() -> None:
         except GameOver as exc:
             print(f"Гру завершено: {exc}")
             print("Кінцеве поле:")
-            print_board(game.board)
+            renderer.render(game.board, force=True)
             break
 
     final_score = game.score
@@ -117,10 +116,10 @@ def demo_game() -> None:
     print(f"Успішність: {stats.get('success_rate', 0.0):.1%}")
     
     scores_file = "saves/scores.txt"
-    save_scores_text(scores_file, ("Player", final_score), ("HighScore", HIGH_SCORE))
+    score_history = {"Player": final_score, "HighScore": HIGH_SCORE}
+    save_scores_text(scores_file, *score_history.items())
     print(f"Результати збережено у {scores_file}")
 
-    score_history = load_scores_text(scores_file)
     save_state_binary("saves/last_state.bin", score_history)
     print("Двоїчний файл збережено у saves/last_state.bin")
 
@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from food_drop.game import DropConfig, Game, GameOver, make_scoring_rule
+import json
+from array import array
+
+import pytest
+
+from food_drop._jit import score_batch
+from food_drop.board import Board
+from food_drop.entities import Player
+from food_drop.game import DropConfig, Game, GameOver, item_stream, make_scoring_rule
+from food_drop.game_state import RECENT_ITEMS_CAPACITY, GameState
+from food_drop.io_utils import TerminalRenderer, print_board
+from food_drop.items import FoodItem, ItemPool
+from food_drop.managers import ItemFactory, LevelManager, ScoreManager
+from food_drop.storage import (
+    load_items_config,
+    load_levels_config,
+    load_scores_text,
+    save_scores_text,
+)
 
 
 def test_scoring_rule_basic():
@@ -15,7 +33,7 @@ def test_game_runs_until_life_loss():
         height=3,
         lives=1,
         allowed_items={"x": 1},
-        forbidden_items=set(),
+        forbidden_items=frozenset(),
         drop_rate=1,
     )
     game = Game(config)
@@ -26,3 +44,231 @@ def test_game_runs_until_life_loss():
     else:
         assert game.lives >= 0
 
+
+def test_run_result_is_a_serialisable_snapshot():
+    config = DropConfig(
+        width=3,
+        height=3,
+        lives=1,
+        allowed_items={"x": 1},
+        forbidden_items=frozenset(),
+    )
+    game = Game(config)
+    result = game.run(max_ticks=1)
+    stats = result["stats"][3]
+    game.score_manager.add_points(1, "food")
+    assert stats == {}
+    json.dumps(result)
+
+
+def test_board_render_stamps_player_and_items():
+    board = Board(3, 2)
+    board.add_player(Player(1, 1))
+    board._place(FoodItem(2, 0, "A"))
+    assert board.render() == ". . A\n. U ."
+    assert board[0] == [".", ".", "A"]
+    assert "A" in board
+    board.clear_cell(2, 0)
+    assert "A" not in board
+
+
+def test_board_keeps_non_latin_symbols():
+    board = Board(3, 2)
+    board.add_player(Player(0, 1))
+    for x, symbol in enumerate(("Я", "🍎", "AB")):
+        board._place(FoodItem(x, 0, symbol))
+    assert board.render() == "Я 🍎 AB\nU . ."
+    assert board.get_row(0) == ["Я", "🍎", "AB"]
+    assert board[0][2] == "AB"
+    assert list(board)[1] == [".", ".", "."]
+    assert "🍎" in board
+    assert board.count_items_by_symbol() == {"Я": 1, "🍎": 1, "AB": 1}
+
+
+def test_terminal_renderer_matches_print_board(capsys):
+    board = Board(3, 2)
+    board.add_player(Player(1, 1))
+    renderer = TerminalRenderer()
+    for _ in range(2):
+        board.drop_items([FoodItem(2, 0, "A")])
+        print_board(board)
+        expected = capsys.readouterr().out
+        assert renderer.render(board)
+        assert capsys.readouterr().out == expected
+    last_row = renderer._prev_lines[-1]
+    assert not renderer.render(board)
+    assert capsys.readouterr().out == ""
+    board.clear_cell(2, 0)
+    assert renderer.render(board)
+    assert renderer._prev_lines[-1] is last_row
+    assert renderer.render(board, force=True)
+
+
+def test_board_item_queries_after_removal():
+    board = Board(4, 4)
+    for x, symbol in enumerate("ABC"):
+        board._place(FoodItem(x, 1, symbol))
+    board._place(FoodItem(3, 2, "A"))
+    board.clear_cell(0, 1)
+    assert board.count_items_by_symbol() == {"A": 1, "B": 1, "C": 1}
+    assert sorted(e.symbol for e in board.get_items_in_row(1)) == ["B", "C"]
+    assert [e.symbol for e in board.get_items_in_range((2, 4), (2, 3))] == ["A"]
+    assert board.items[6].symbol == "C"
+    assert 4 not in board.items
+
+
+def test_drop_items_moves_entities_in_place():
+    board = Board(2, 2)
+    top = FoodItem(0, 0, "A")
+    bottom = FoodItem(1, 1, "B")
+    board._place(top)
+    board._place(bottom)
+    board.add_player(Player(0, 1))
+    missed = board.drop_items([FoodItem(1, 0, "C")])
+    assert missed == [bottom]
+    assert board.items[2] is top and top.y == 1
+    assert board.caught is top
+    assert board.render() == ". C\nU ."
+    board.clear_cell(0, 1)
+    assert board.caught is None
+
+
+def test_range_query_uses_row_and_column_buckets():
+    board = Board(5, 5)
+    for x, y in [(0, 0), (1, 1), (1, 3), (4, 4)]:
+        board._place(FoodItem(x, y, "A"))
+    board.drop_items([])
+    assert [(e.x, e.y) for e in board.get_items_in_range((1, 2), (0, 5))] == [(1, 2), (1, 4)]
+    assert [(e.x, e.y) for e in board.get_items_in_range((0, 5), (1, 2))] == [(0, 1)]
+    assert board.get_items_in_row(9) == []
+
+
+def test_game_state_keeps_bounded_recent_items():
+    state = GameState()
+    for i in range(RECENT_ITEMS_CAPACITY + 5):
+        state.record_item("food" if i % 2 else "powerup")
+    assert state.collected_count == RECENT_ITEMS_CAPACITY + 5
+    assert state.food_count == (RECENT_ITEMS_CAPACITY + 5) // 2
+    assert isinstance(state.collected_items, tuple)
+    assert len(state.collected_items) == RECENT_ITEMS_CAPACITY
+    assert state.get_recent_items(3) == ["powerup", "food", "powerup"]
+    assert state.get_statistics_summary()["items_collected"] == RECENT_ITEMS_CAPACITY + 5
+
+
+def test_game_state_round_trip_past_capacity():
+    state = GameState()
+    for i in range(RECENT_ITEMS_CAPACITY + 3):
+        state.record_item("food" if i % 3 == 0 else "powerup")
+    restored = GameState()
+    restored.from_dict(state.to_dict())
+    assert restored.get_recent_items(5) == state.get_recent_items(5)
+    assert restored.collected_items == state.collected_items
+    assert (restored.collected_count, restored.food_count) == (state.collected_count, state.food_count)
+    from_tuple = GameState()
+    from_tuple.from_tuple(state.as_tuple())
+    assert from_tuple.as_tuple() == state.as_tuple()
+    assert from_tuple.food_count == (RECENT_ITEMS_CAPACITY + 3 + 2) // 3
+
+
+def test_item_pool_reinitialises_released_items():
+    pool = ItemPool()
+    first = pool.get(FoodItem, 0, 0, "A", 1)
+    first.collect()
+    pool.put(first)
+    second = pool.get(FoodItem, 2, 0, "B", 3)
+    assert second is first
+    assert (second.x, second.symbol, second.points, second.is_collected) == (2, "B", 3, False)
+    assert len(pool) == 0
+
+
+def test_item_stream_samples_types_by_weight():
+    factory = ItemFactory(config={
+        "food": {"A": {"name": "Apple"}, "_weight": 3},
+        "forbidden": {"X": {"name": "Rock"}, "_weight": 0},
+        "powerup": {"P": {"name": "Star"}},
+    }, seed=1, drop_types=("food", "forbidden"))
+    assert factory.sample_item_types(20) == ["food"] * 20
+    config = DropConfig(
+        width=3,
+        height=3,
+        lives=1,
+        allowed_items={},
+        forbidden_items=frozenset(),
+        drop_rate=4,
+        drop_chance=1.0,
+    )
+    batch = next(item_stream(config, factory))
+    assert [(item.symbol, item.name) for item in batch] == [("A", "Apple")] * 4
+    assert "_weight" not in factory.create_random_item(0, 0, "food").symbol
+
+
+def test_level_manager_tracks_items_for_previous_levels():
+    manager = LevelManager({"levels": {"1": {"items_required": 2}, "2": {"items_required": 3}}})
+    assert manager.check_level_up_by_items(2)
+    assert not manager.check_level_up_by_items(4)
+    assert manager.check_level_up_by_items(5)
+    assert manager.current_level == 3
+    assert manager.items_threshold == 9
+    assert manager.get_items_collected_on_current_level(6) == 1
+
+
+def test_config_parsers_handle_spacing_and_bad_numbers(tmp_path):
+    items_path = tmp_path / "items.txt"
+    items_path.write_text("# comment\nfood : A : Apple : 2\nforbidden:X:Rock:lots\n", encoding="utf-8")
+    levels_path = tmp_path / "levels.txt"
+    levels_path.write_text("1:4:.5\n2:x:fast:Hard\n", encoding="utf-8")
+    items = load_items_config(str(items_path))
+    assert items["food"]["A"]["points"] == 2
+    assert items["forbidden"]["X"]["damage"] == 0
+    levels = load_levels_config(str(levels_path))
+    assert levels[1] == {"items_required": 4, "drop_chance": 0.5, "description": "Level 1"}
+    assert levels[2] == {"items_required": 5, "drop_chance": 0.3, "description": "Hard"}
+    with pytest.raises(TypeError):
+        items["food"]["A"]["points"] = 99
+    assert load_items_config(str(items_path))["food"]["A"]["points"] == 2
+
+
+def test_score_observers_filter_by_event_and_level():
+    manager = ScoreManager()
+    every, milestones, other = [], [], []
+    manager.attach_observer(lambda event, data: every.append(data["total"]), events=("score_changed",))
+    manager.attach_observer(lambda event, data: milestones.append(data["total"]), events=("score_changed",), level=1)
+    manager.attach_observer(lambda event, data: other.append(event), events=("multiplier_changed",))
+    for _ in range(10):
+        manager.add_points(1, "food")
+    assert every == list(range(1, 11))
+    assert milestones == [5, 10]
+    assert other == []
+
+
+def test_score_batch_fills_output_in_place():
+    for kernel in {score_batch, getattr(score_batch, "py_func", score_batch)}:
+        out = array("q", bytes(8 * 3))
+        assert kernel(array("q", [1, 3, 4]), array("d", [1.0, 1.5, 2.0]), out) == 13
+        assert list(out) == [1, 4, 8]
+
+
+def test_add_points_batch_matches_add_points():
+    single, batch = ScoreManager(), ScoreManager()
+    points = [1, 5, 0, 3, 2]
+    item_types = ["food", "powerup", "food", "food", "bonus"]
+    for value, item_type in zip(points, item_types):
+        single.add_points(value, item_type)
+    events = []
+    batch.attach_observer(lambda event, data: events.append(data), events=("score_changed",))
+    assert batch.add_points_batch(points, item_types=item_types) == single.total_score
+    assert batch.get_stats_tuple() == single.get_stats_tuple()
+    assert events == [{"points": 11, "total": 11, "item_counts": {"food": 3, "powerup": 1, "bonus": 1}}]
+    milestones = []
+    batch.attach_observer(lambda event, data: milestones.append(data["total"]), events=("score_changed",), level=1)
+    batch.add_points_batch([1, 1], item_types="food")
+    assert milestones == []
+    batch.add_points_batch([1, 1, 1, 1], item_types="food")
+    assert milestones == [17]
+    assert batch.combo_count == 8
+
+
+def test_scores_round_trip(tmp_path):
+    path = str(tmp_path / "scores.txt")
+    save_scores_text(path, ("Гравець", 7), ("HighScore", 12))
+    assert load_scores_text(path) == {"Гравець": 7, "HighScore": 12}